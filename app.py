@@ -26,8 +26,9 @@ from config import (
     POST_API_KEY,
     POST_API_TIMEOUT,
     PDF_TEMPLATE_PATH,
+    PDF_TEMPLATE_PRE_REDACTED,
 )
-from fill_visa_form import generate_filled_pdf_bytes
+from fill_visa_form import generate_filled_pdf_bytes, ARABIC_FONT
 
 # Configure logging
 logging.basicConfig(
@@ -35,6 +36,7 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
+logger.info(f"Arabic font: {ARABIC_FONT.name}")
 
 # Initialize Flask app
 app = Flask(__name__)
@@ -160,7 +162,9 @@ def webhook():
         
         # Generate the filled PDF
         logger.info("Generating filled PDF...")
-        pdf_bytes, full_name = generate_filled_pdf_bytes(data, PDF_TEMPLATE_PATH)
+        pdf_bytes, full_name = generate_filled_pdf_bytes(
+            data, PDF_TEMPLATE_PATH, pre_redacted=PDF_TEMPLATE_PRE_REDACTED
+        )
         logger.info(f"PDF generated for: {full_name}")
         
         # Send to external API
@@ -215,7 +219,9 @@ def generate_only():
             }), 400
         
         # Generate the filled PDF
-        pdf_bytes, full_name = generate_filled_pdf_bytes(data, PDF_TEMPLATE_PATH)
+        pdf_bytes, full_name = generate_filled_pdf_bytes(
+            data, PDF_TEMPLATE_PATH, pre_redacted=PDF_TEMPLATE_PRE_REDACTED
+        )
         
         # Return PDF as file download
         return Response(
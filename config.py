@@ -4,6 +4,7 @@ Configuration settings for the Visa Form Webhook Server
 Set these as environment variables in Railway/Render:
 - POST_API_URL: Your external API endpoint
 - POST_API_KEY: API key for authentication (optional)
+- PDF_TEMPLATE_PATH / PDF_TEMPLATE_PRE_REDACTED: template override (optional)
 """
 import os
 
@@ -17,6 +18,12 @@ POST_API_URL = os.environ.get("POST_API_URL", "https://your-api-endpoint.com/upl
 POST_API_KEY = os.environ.get("POST_API_KEY", "")
 POST_API_TIMEOUT = int(os.environ.get("POST_API_TIMEOUT", 30))
 
-# PDF template path
-PDF_TEMPLATE_PATH = os.environ.get("PDF_TEMPLATE_PATH", "Visa_Application_Form.pdf")
+# PDF template path (defaults to the copy pre-redacted by scripts/preprocess_template.py)
+REDACTED_TEMPLATE_NAME = "Visa_Application_Form_redacted.pdf"
+PDF_TEMPLATE_PATH = os.environ.get("PDF_TEMPLATE_PATH", REDACTED_TEMPLATE_NAME)
+# Runtime redaction is skipped only for the shipped redacted template unless overridden
+PDF_TEMPLATE_PRE_REDACTED = os.environ.get(
+    "PDF_TEMPLATE_PRE_REDACTED",
+    str(os.path.basename(PDF_TEMPLATE_PATH) == REDACTED_TEMPLATE_NAME),
+).lower() == "true"
 
@@ -6,6 +6,9 @@ PDF Page size: 612 x 792 points (US Letter)
 Coordinates extracted from PDF analysis.
 """
 
+from types import MappingProxyType
+from typing import Mapping
+
 # Font settings
 FONT_NAME = "helv"  # Helvetica
 FONT_SIZE = 9
@@ -218,16 +221,94 @@ TEXT_FIELD_MAPPINGS = {
     "accommodation_info.lebanon_address": "lebanon_address",
 }
 
+# JSON key paths whose value is written into several coordinate keys
+# (Dubai departure/return dates double as trip duration and arrival/departure dates)
+TEXT_FIELD_FANOUT_MAPPINGS = (
+    (("trip_info", "departure_date_from_dubai"), ("trip_start_date", "arrival_date")),
+    (("trip_info", "arrival_date_to_dubai"), ("trip_end_date", "departure_date")),
+)
+
+# JSON key paths read directly for the bottom-of-page labels
+ACCOMPANY_NAME_KEYS = ("accompany_name",)
+VISA_TYPE_KEYS = ("visa_info", "type")
+
+# The tables above are static: freeze them (read-only views, float coordinates)
+# so they can be shared safely, e.g. by forked worker processes
+FIELD_COORDINATES = MappingProxyType(
+    {key: (float(x), float(y)) for key, (x, y) in FIELD_COORDINATES.items()}
+)
+CHECKBOX_MAPPINGS = MappingProxyType(
+    {section: MappingProxyType(values) for section, values in CHECKBOX_MAPPINGS.items()}
+)
+TEXT_FIELD_MAPPINGS = MappingProxyType(TEXT_FIELD_MAPPINGS)
+
+# Coordinate keys used directly by fill_text_fields
+LABEL_COORDINATE_KEYS = ("accompanied_by_arabic", "visa_type_label")
+
+
+def _validate_mappings():
+    """Ensure every coordinate key referenced by the mappings exists in FIELD_COORDINATES."""
+    referenced = [
+        *(key for section in CHECKBOX_MAPPINGS.values() for key in section.values()),
+        *TEXT_FIELD_MAPPINGS.values(),
+        *(key for _, coord_keys in TEXT_FIELD_FANOUT_MAPPINGS for key in coord_keys),
+        *LABEL_COORDINATE_KEYS,
+    ]
+    missing = sorted(set(referenced) - FIELD_COORDINATES.keys())
+    if missing:
+        raise ValueError(f"Coordinate keys missing from FIELD_COORDINATES: {missing}")
+
+
+# Checked at import so the lookups below (and in fill_visa_form) can index directly
+_validate_mappings()
+
+
+def _resolve_checkbox_coordinates(section: str) -> Mapping:
+    """Map each accepted value in a CHECKBOX_MAPPINGS section straight to its (x, y)."""
+    return MappingProxyType({
+        value: FIELD_COORDINATES[checkbox_key]
+        for value, checkbox_key in CHECKBOX_MAPPINGS[section].items()
+    })
+
+
+# Lowercase data value -> (x, y), resolved once at import time
+SEX_CHECKBOX_COORDINATES = _resolve_checkbox_coordinates("sex")
+MARITAL_STATUS_CHECKBOX_COORDINATES = _resolve_checkbox_coordinates("marital_status")
+PURPOSE_OF_TRIP_CHECKBOX_COORDINATES = _resolve_checkbox_coordinates("purpose_of_trip")
+VISA_TYPE_CHECKBOX_COORDINATES = _resolve_checkbox_coordinates("visa_type")
+VISA_DURATION_CHECKBOX_COORDINATES = _resolve_checkbox_coordinates("visa_duration")
+
+# TEXT_FIELD_MAPPINGS resolved once at import time into
+# ((json_key, ...), x, y) entries so the fill loop needs no splitting or
+# secondary coordinate lookups
+TEXT_FIELD_MAPPINGS_COMPILED = tuple(
+    (tuple(json_path.split(".")), *FIELD_COORDINATES[coord_key])
+    for json_path, coord_key in TEXT_FIELD_MAPPINGS.items()
+)
+
+
+def _group_by_section(compiled_mappings: tuple) -> Mapping:
+    """Group compiled entries by their top-level JSON key (None for root-level keys)."""
+    grouped = {}
+    for keys, x, y in compiled_mappings:
+        section, rest = (keys[0], keys[1:]) if len(keys) > 1 else (None, keys)
+        grouped.setdefault(section, []).append((rest, x, y))
+    return MappingProxyType({section: tuple(entries) for section, entries in grouped.items()})
+
+
+# Compiled entries keyed by section so a missing section is skipped with one lookup
+TEXT_FIELD_MAPPINGS_BY_SECTION = _group_by_section(TEXT_FIELD_MAPPINGS_COMPILED)
+
 # Arabic text prefix for accompaniment
 ARABIC_ACCOMPANIED_BY_PREFIX = "ﺑﻤﺮاﻓﻘﺔ  "
 
 # Visa type pricing labels
-VISA_TYPE_LABELS = {
+VISA_TYPE_LABELS = MappingProxyType({
     "single_entry": "Single Entry 3M AED 325 ",
     "single": "Single Entry 3M AED 325 ",
     "two_entry": "Two Entry 3M AED 465 ",
     "double": "Two Entry 3M AED 465 ",
     "multiple_entry": "Multiple Entry 6M AED 645 ",
     "multiple": "Multiple Entry 6M AED   645 ",
-}
+})
 
@@ -11,13 +11,22 @@ Usage (CLI):
 Usage (API):
     from fill_visa_form import generate_filled_pdf_bytes
     pdf_bytes, full_name = generate_filled_pdf_bytes(applicant_data_dict, template_path)
+
+    # Many applicants in parallel, one process per core
+    from fill_visa_form import generate_many
+    results = generate_many(applicant_data_dicts, template_path)
 """
 
 import argparse
+import functools
 import json
+import logging
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Tuple
+from typing import Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
 
 try:
     import fitz  # PyMuPDF
@@ -31,19 +40,23 @@ try:
     ARABIC_SUPPORT = True
 except ImportError:
     ARABIC_SUPPORT = False
-    print("Warning: arabic-reshaper or python-bidi not installed. Arabic text may not display correctly.")
+    logger.warning("arabic-reshaper or python-bidi not installed. Arabic text may not display correctly.")
 
 try:
     from deep_translator import GoogleTranslator
     TRANSLATION_SUPPORT = True
 except ImportError:
     TRANSLATION_SUPPORT = False
-    print("Warning: deep-translator not installed. Arabic translation will not work.")
+    logger.warning("deep-translator not installed. Arabic translation will not work.")
 
 from field_config import (
     FIELD_COORDINATES,
-    CHECKBOX_MAPPINGS,
-    TEXT_FIELD_MAPPINGS,
+    VISA_TYPE_CHECKBOX_COORDINATES,
+    VISA_DURATION_CHECKBOX_COORDINATES,
+    TEXT_FIELD_MAPPINGS_BY_SECTION,
+    TEXT_FIELD_FANOUT_MAPPINGS,
+    ACCOMPANY_NAME_KEYS,
+    VISA_TYPE_KEYS,
     FONT_NAME,
     FONT_SIZE,
     CHECKBOX_CHAR,
@@ -53,20 +66,22 @@ from field_config import (
     BOTTOM_LABEL_FONT_SIZE,
 )
 
+# Latin font shared by every TextWriter append (text fields and checkboxes)
+TEXT_FONT = fitz.Font(FONT_NAME)
 
-def get_nested_value(data: dict, path: str):
+
+def get_nested_value_by_keys(data: dict, keys: tuple):
     """
-    Get a value from nested dictionary using dot notation.
-    Example: get_nested_value(data, "personal_info.last_name")
+    Get a value from nested dictionary using a precomputed key path.
+    Example: get_nested_value_by_keys(data, ("personal_info", "last_name"))
     """
-    keys = path.split(".")
-    value = data
-    for key in keys:
-        if isinstance(value, dict) and key in value:
+    try:
+        value = data
+        for key in keys:
             value = value[key]
-        else:
-            return None
-    return value
+        return value
+    except (KeyError, TypeError):
+        return None
 
 
 def load_applicant_data(json_path: str) -> dict:
@@ -75,6 +90,12 @@ def load_applicant_data(json_path: str) -> dict:
         return json.load(f)
 
 
+@functools.lru_cache(maxsize=4)
+def load_template_bytes(template_path: str) -> bytes:
+    """Read the PDF template from disk once and keep its bytes in memory."""
+    return Path(template_path).read_bytes()
+
+
 def extract_full_name(data: dict) -> str:
     """Extract full name from applicant data."""
     personal = data.get("personal_info", {})
@@ -91,32 +112,17 @@ def extract_full_name(data: dict) -> str:
     return " ".join(name_parts)
 
 
-def insert_text(page, x: float, y: float, text: str, fontsize: int = FONT_SIZE):
-    """Insert text at specified coordinates on the PDF page.
+def insert_text(writer, x: float, y: float, text: str, fontsize: int = FONT_SIZE):
+    """Queue text at specified coordinates on the page's TextWriter.
     N/A values are included as per form instructions.
+    Callers skip empty and whitespace-only text.
     """
-    if text and text.strip():
-        # Create text insertion point
-        point = fitz.Point(x, y)
-        page.insert_text(
-            point,
-            text,
-            fontname=FONT_NAME,
-            fontsize=fontsize,
-            color=(0, 0, 0),  # Black text
-        )
+    writer.append((x, y), text, font=TEXT_FONT, fontsize=fontsize)
 
 
-def insert_checkbox(page, x: float, y: float):
-    """Insert a checkbox mark (X) at specified coordinates."""
-    point = fitz.Point(x, y)
-    page.insert_text(
-        point,
-        CHECKBOX_CHAR,
-        fontname=FONT_NAME,
-        fontsize=CHECKBOX_FONT_SIZE,
-        color=(0, 0, 0),
-    )
+def insert_checkbox(writer, x: float, y: float):
+    """Queue a checkbox mark (X) at specified coordinates."""
+    writer.append((x, y), CHECKBOX_CHAR, font=TEXT_FONT, fontsize=CHECKBOX_FONT_SIZE)
 
 
 def redact_area(page, x: float, y: float, width: float, height: float):
@@ -134,7 +140,7 @@ def redact_existing_dates(page):
     redact_area(page, 328, 382, 215, 12)
 
 
-def fill_checkboxes(page, data: dict):
+def fill_checkboxes(writer, data: dict):
     """Fill all checkbox fields based on data values."""
     
     # NOTE: Fields 12 (Sex), 17 (Marital Status), and 21 (Purpose of Trip)
@@ -145,11 +151,9 @@ def fill_checkboxes(page, data: dict):
     
     # Visa Type
     visa_type = visa.get("type", "").lower()
-    if visa_type in CHECKBOX_MAPPINGS["visa_type"]:
-        checkbox_key = CHECKBOX_MAPPINGS["visa_type"][visa_type]
-        if checkbox_key in FIELD_COORDINATES:
-            x, y = FIELD_COORDINATES[checkbox_key]
-            insert_checkbox(page, x, y)
+    coords = VISA_TYPE_CHECKBOX_COORDINATES.get(visa_type)
+    if coords:
+        insert_checkbox(writer, *coords)
     
     # Visa Duration - automatically determined by visa type
     # Single/Two Entry = 3 months, Multiple Entry = 6 months
@@ -158,177 +162,231 @@ def fill_checkboxes(page, data: dict):
     else:
         visa_duration = "three_months"
     
-    if visa_duration in CHECKBOX_MAPPINGS["visa_duration"]:
-        checkbox_key = CHECKBOX_MAPPINGS["visa_duration"][visa_duration]
-        if checkbox_key in FIELD_COORDINATES:
-            x, y = FIELD_COORDINATES[checkbox_key]
-            insert_checkbox(page, x, y)
+    coords = VISA_DURATION_CHECKBOX_COORDINATES.get(visa_duration)
+    if coords:
+        insert_checkbox(writer, *coords)
+
+
+@functools.lru_cache(maxsize=1024)
+def fetch_arabic_translation(text: str) -> str:
+    """Call Google Translate once per distinct text; failures are not cached."""
+    # GoogleTranslator mutates its request params on every call, so each call
+    # gets its own instance (a shared one is unsafe under threaded servers)
+    translator = GoogleTranslator(source='auto', target='ar')
+    translated = translator.translate(text)
+    logger.debug(f"Translated '{text}' to Arabic: '{translated}'")
+    return translated
 
 
 def translate_to_arabic(text: str) -> str:
     """Translate text to Arabic using Google Translate."""
     if not TRANSLATION_SUPPORT:
-        print("Warning: Translation not available, returning original text")
+        logger.debug("Translation not available, returning original text")
         return text
     
     if not text or not text.strip():
         return text
     
     try:
-        translator = GoogleTranslator(source='auto', target='ar')
-        translated = translator.translate(text)
-        print(f"✓ Translated '{text}' to Arabic: '{translated}'")
-        return translated
+        return fetch_arabic_translation(text)
     except Exception as e:
-        print(f"Warning: Translation failed for '{text}': {e}")
+        logger.warning(f"Translation failed for '{text}': {e}")
         return text
 
 
-def reshape_arabic_text(text: str) -> str:
+@functools.lru_cache(maxsize=1024)
+def reshape_arabic_text(text: str, base_dir=None) -> str:
     """Reshape Arabic text for proper display (connected letters, RTL)."""
     if ARABIC_SUPPORT:
         # Reshape Arabic characters to connect properly
         reshaped_text = arabic_reshaper.reshape(text)
         # Apply bidirectional algorithm for RTL display
-        bidi_text = get_display(reshaped_text)
+        bidi_text = get_display(reshaped_text, base_dir=base_dir)
         return bidi_text
     return text
 
 
-def insert_arabic_text(page, x: float, y: float, text: str, fontsize: int = FONT_SIZE):
-    """Insert Arabic text at specified coordinates using an Arabic-supporting font."""
-    if text and text.strip():
-        # Reshape the Arabic text for proper rendering
-        display_text = reshape_arabic_text(text)
-        point = fitz.Point(x, y)
-        
-        # Try different Arabic font approaches in order of preference
-        font_attempts = [
-            # 1. Try macOS fonts (for local development)
-            {"fontfile": "/System/Library/Fonts/GeezaPro.ttc", "fontname": "GeezaPro"},
-            {"fontfile": "/System/Library/Fonts/SFArabic.ttf", "fontname": "SFArabic"},
-            # 2. Try common Linux fonts (for Railway/production)
-            {"fontfile": "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", "fontname": "DejaVuSans"},
-            {"fontfile": "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf", "fontname": "LiberationSans"},
-            {"fontfile": "/usr/share/fonts/truetype/noto/NotoSansArabic-Regular.ttf", "fontname": "NotoSansArabic"},
-            {"fontfile": "/usr/share/fonts/truetype/freefont/FreeSans.ttf", "fontname": "FreeSans"},
-            # 3. Try PyMuPDF built-in fonts
-            {"fontname": "figo"},  # Built-in font with good Unicode support
-        ]
-        
-        text_inserted = False
-        last_error = None
-        
-        for font_config in font_attempts:
+# The prefix is constant, so it is reshaped once; names are reshaped with an
+# RTL base direction and placed to its left (visual order)
+RESHAPED_ACCOMPANIED_BY_PREFIX = reshape_arabic_text(ARABIC_ACCOMPANIED_BY_PREFIX)
+
+# Arabic font candidates in order of preference
+ARABIC_FONT_ATTEMPTS = [
+    # 1. Try macOS fonts (for local development)
+    {"fontfile": "/System/Library/Fonts/GeezaPro.ttc", "fontname": "GeezaPro"},
+    {"fontfile": "/System/Library/Fonts/SFArabic.ttf", "fontname": "SFArabic"},
+    # 2. Try common Linux fonts (for Railway/production)
+    {"fontfile": "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", "fontname": "DejaVuSans"},
+    {"fontfile": "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf", "fontname": "LiberationSans"},
+    {"fontfile": "/usr/share/fonts/truetype/noto/NotoSansArabic-Regular.ttf", "fontname": "NotoSansArabic"},
+    {"fontfile": "/usr/share/fonts/truetype/freefont/FreeSans.ttf", "fontname": "FreeSans"},
+    # 3. Try PyMuPDF built-in fonts
+    {"fontname": "figo"},  # Built-in font with good Unicode support
+]
+
+
+def resolve_arabic_font():
+    """Return the first loadable Arabic font, falling back to Helvetica."""
+    last_error = None
+    for font_config in ARABIC_FONT_ATTEMPTS:
+        # Skip missing font files without a MuPDF round trip
+        fontfile = font_config.get("fontfile")
+        if fontfile and not os.path.exists(fontfile):
+            last_error = f"{fontfile} not found"
+            continue
+        try:
+            font = fitz.Font(**font_config)
+        except Exception as e:
+            last_error = e
+            continue
+        logger.debug(f"Arabic text will use: {font_config}")
+        return font
+    
+    # Helvetica won't render Arabic properly but is better than nothing
+    logger.warning(
+        f"All preferred Arabic fonts failed, using Helvetica (may not render correctly). "
+        f"Last error: {last_error}"
+    )
+    return TEXT_FONT
+
+
+# Resolved once at import instead of probing fonts on every PDF
+ARABIC_FONT = resolve_arabic_font()
+
+
+def insert_arabic_text(writer, x: float, y: float, display_text: str, fontsize: int = FONT_SIZE):
+    """Queue already reshaped Arabic text at specified coordinates using the Arabic font."""
+    if display_text and display_text.strip():
+        writer.append((x, y), display_text, font=ARABIC_FONT, fontsize=fontsize)
+
+
+def fill_text_fields(writer, data: dict) -> bool:
+    """Fill all text fields based on data values.
+    Returns True if Arabic text was queued (its font is embedded whole).
+    """
+    arabic_queued = False
+    for section, entries in TEXT_FIELD_MAPPINGS_BY_SECTION.items():
+        section_data = data if section is None else data.get(section)
+        if not isinstance(section_data, dict):
+            continue
+        for keys, x, y in entries:
             try:
-                page.insert_text(
-                    point,
-                    display_text,
-                    fontsize=fontsize,
-                    color=(0, 0, 0),
-                    **font_config
-                )
-                text_inserted = True
-                print(f"✓ Arabic text inserted using: {font_config}")
-                break
-            except Exception as e:
-                last_error = e
+                value = section_data
+                for key in keys:
+                    value = value[key]
+            except (KeyError, TypeError):
                 continue
-        
-        # If all attempts failed, try with base Helvetica (won't render Arabic properly but better than nothing)
-        if not text_inserted:
-            try:
-                print(f"Warning: All preferred fonts failed, using fallback. Last error: {last_error}")
-                page.insert_text(
-                    point,
-                    display_text,
-                    fontname="helv",
-                    fontsize=fontsize,
-                    color=(0, 0, 0),
-                )
-                print("⚠ Arabic text inserted with Helvetica (may not render correctly)")
-            except Exception as e:
-                print(f"Error: Failed to insert Arabic text: {e}")
-
-
-def fill_text_fields(page, data: dict):
-    """Fill all text fields based on data values."""
-    for json_path, coord_key in TEXT_FIELD_MAPPINGS.items():
-        value = get_nested_value(data, json_path)
-        if value and coord_key in FIELD_COORDINATES:
+            # Most values are already strings; avoid str() and strip() copies
+            if isinstance(value, str):
+                text = value
+            elif value:
+                text = str(value)
+            else:
+                continue
+            if not text or text.isspace():
+                continue
+            insert_text(writer, x, y, text)
+    
+    # Fill each Dubai trip date into both of its form fields
+    for json_keys, coord_keys in TEXT_FIELD_FANOUT_MAPPINGS:
+        value = get_nested_value_by_keys(data, json_keys)
+        if not value:
+            continue
+        text = value if isinstance(value, str) else str(value)
+        if text.isspace():
+            continue
+        for coord_key in coord_keys:
             x, y = FIELD_COORDINATES[coord_key]
-            insert_text(page, x, y, str(value))
-    
-    # Fill departure_date_from_dubai to both trip_start_date and arrival_date fields
-    departure_from_dubai = get_nested_value(data, "trip_info.departure_date_from_dubai")
-    if departure_from_dubai:
-        if "trip_start_date" in FIELD_COORDINATES:
-            x, y = FIELD_COORDINATES["trip_start_date"]
-            insert_text(page, x, y, str(departure_from_dubai))
-        if "arrival_date" in FIELD_COORDINATES:
-            x, y = FIELD_COORDINATES["arrival_date"]
-            insert_text(page, x, y, str(departure_from_dubai))
-    
-    # Fill arrival_date_to_dubai to both trip_end_date and departure_date fields
-    arrival_to_dubai = get_nested_value(data, "trip_info.arrival_date_to_dubai")
-    if arrival_to_dubai:
-        if "trip_end_date" in FIELD_COORDINATES:
-            x, y = FIELD_COORDINATES["trip_end_date"]
-            insert_text(page, x, y, str(arrival_to_dubai))
-        if "departure_date" in FIELD_COORDINATES:
-            x, y = FIELD_COORDINATES["departure_date"]
-            insert_text(page, x, y, str(arrival_to_dubai))
+            insert_text(writer, x, y, text)
     
     # Auto-translate accompany_name to Arabic for the accompanied_by field
-    accompany_name = get_nested_value(data, "accompany_name")
-    if accompany_name and "accompanied_by_arabic" in FIELD_COORDINATES:
+    accompany_name = get_nested_value_by_keys(data, ACCOMPANY_NAME_KEYS)
+    if accompany_name:
         translated_name = translate_to_arabic(accompany_name)
-        arabic_text = ARABIC_ACCOMPANIED_BY_PREFIX + translated_name
+        display_text = reshape_arabic_text(translated_name, base_dir="R") + RESHAPED_ACCOMPANIED_BY_PREFIX
         x, y = FIELD_COORDINATES["accompanied_by_arabic"]
-        insert_arabic_text(page, x, y, arabic_text, fontsize=BOTTOM_LABEL_FONT_SIZE)
+        insert_arabic_text(writer, x, y, display_text, fontsize=BOTTOM_LABEL_FONT_SIZE)
+        arabic_queued = True
     
     # Add visa type pricing label on the left side
-    visa_type = get_nested_value(data, "visa_info.type")
-    if visa_type and "visa_type_label" in FIELD_COORDINATES:
+    visa_type = get_nested_value_by_keys(data, VISA_TYPE_KEYS)
+    if visa_type:
         visa_type_lower = visa_type.lower()
         if visa_type_lower in VISA_TYPE_LABELS:
             label_text = VISA_TYPE_LABELS[visa_type_lower]
             x, y = FIELD_COORDINATES["visa_type_label"]
-            insert_text(page, x, y, label_text, fontsize=BOTTOM_LABEL_FONT_SIZE)
+            insert_text(writer, x, y, label_text, fontsize=BOTTOM_LABEL_FONT_SIZE)
+    
+    return arabic_queued
+
+
+def subset_embedded_fonts(doc, arabic_queued: bool):
+    """Subset fonts before saving when Arabic text was written.
+    
+    Arabic font files are embedded in full (hundreds of KB); subsetting them is
+    cheaper than deflating and shipping the whole font. The built-in Helvetica
+    is small enough that subsetting it costs more than it saves.
+    A subsetting failure is logged and the document is saved unsubsetted.
+    """
+    if not arabic_queued or ARABIC_FONT is TEXT_FONT:
+        return
+    try:
+        doc.subset_fonts()
+    except Exception as e:
+        logger.warning(f"Font subsetting failed, saving with full fonts: {e}")
 
 
-def generate_filled_pdf_bytes(data: dict, template_path: str) -> Tuple[bytes, str]:
+def generate_filled_pdf_bytes(
+    data: dict,
+    template_path: str,
+    fast: bool = True,
+    pre_redacted: bool = False,
+) -> Tuple[bytes, str]:
     """
     Generate a filled PDF from applicant data and return as bytes.
     
     Args:
         data: Dictionary containing applicant data
         template_path: Path to the blank PDF form template
+        fast: Only deflate streams; skip the expensive garbage collection and
+            content-stream cleaning (slightly larger output)
+        pre_redacted: The template was already redacted by
+            scripts/preprocess_template.py, so skip the runtime redaction
     
     Returns:
         Tuple of (pdf_bytes, full_name)
     """
-    # Open the PDF template
-    doc = fitz.open(template_path)
+    # Open the PDF template from the cached bytes (no disk read per request)
+    doc = fitz.open(stream=load_template_bytes(template_path), filetype="pdf")
     
     # Get the first page (the form is typically on page 1)
     page = doc[0]
     
     # Redact pre-existing dates at point 19
-    redact_existing_dates(page)
+    if not pre_redacted:
+        redact_existing_dates(page)
+    
+    # Collect all text in one TextWriter and write it to the page in a single pass
+    writer = fitz.TextWriter(page.rect)
     
     # Fill checkboxes
-    fill_checkboxes(page, data)
+    fill_checkboxes(writer, data)
     
     # Fill text fields
-    fill_text_fields(page, data)
+    arabic_queued = fill_text_fields(writer, data)
+    
+    writer.write_text(page)
+    subset_embedded_fonts(doc, arabic_queued)
     
     # Get PDF as bytes with compression options
-    pdf_bytes = doc.tobytes(
-        garbage=4,  # Maximum garbage collection (remove unused objects)
-        deflate=True,  # Compress streams
-        clean=True,  # Clean and sanitize content streams
-    )
+    if fast:
+        pdf_bytes = doc.tobytes(deflate=True)
+    else:
+        pdf_bytes = doc.tobytes(
+            garbage=4,  # Maximum garbage collection (remove unused objects)
+            deflate=True,  # Compress streams
+            clean=True,  # Clean and sanitize content streams
+        )
     
     doc.close()
     
@@ -338,7 +396,40 @@ def generate_filled_pdf_bytes(data: dict, template_path: str) -> Tuple[bytes, st
     return pdf_bytes, full_name
 
 
-def fill_visa_form(template_path: str, data_path: str, output_path: str):
+def generate_many(
+    data_list: Iterable[dict],
+    template_path: str,
+    workers: Optional[int] = None,
+    fast: bool = True,
+    pre_redacted: bool = False,
+) -> List[Tuple[bytes, str]]:
+    """
+    Generate filled PDFs for many applicants in parallel worker processes.
+    
+    Each worker caches the template bytes, so the file is read once per
+    process rather than once per applicant.
+    
+    Args:
+        data_list: Applicant data dictionaries
+        template_path: Path to the blank PDF form template
+        workers: Number of worker processes (default: number of CPUs)
+        fast: Passed through to generate_filled_pdf_bytes
+        pre_redacted: Passed through to generate_filled_pdf_bytes
+    
+    Returns:
+        List of (pdf_bytes, full_name) tuples in the same order as data_list
+    """
+    generate = functools.partial(
+        generate_filled_pdf_bytes,
+        template_path=template_path,
+        fast=fast,
+        pre_redacted=pre_redacted,
+    )
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(generate, data_list))
+
+
+def fill_visa_form(template_path: str, data_path: str, output_path: str, pre_redacted: bool = False):
     """
     Main function to fill the visa application form and save to file.
     
@@ -346,6 +437,7 @@ def fill_visa_form(template_path: str, data_path: str, output_path: str):
         template_path: Path to the blank PDF form
         data_path: Path to the JSON file with applicant data
         output_path: Path for the filled PDF output
+        pre_redacted: The template was already redacted, so skip the runtime redaction
     """
     # Ensure output directory exists
     output_dir = os.path.dirname(output_path)
@@ -353,38 +445,48 @@ def fill_visa_form(template_path: str, data_path: str, output_path: str):
         os.makedirs(output_dir, exist_ok=True)
     
     # Load applicant data
-    print(f"Loading applicant data from: {data_path}")
+    logger.info(f"Loading applicant data from: {data_path}")
     data = load_applicant_data(data_path)
     
     # Open the PDF template
-    print(f"Opening PDF template: {template_path}")
+    logger.info(f"Opening PDF template: {template_path}")
+    logger.info(f"Arabic font: {ARABIC_FONT.name}")
     doc = fitz.open(template_path)
     
     # Get the first page (the form is typically on page 1)
     page = doc[0]
     
     # Redact pre-existing dates at point 19
-    print("Redacting pre-filled dates...")
-    redact_existing_dates(page)
+    if not pre_redacted:
+        logger.info("Redacting pre-filled dates...")
+        redact_existing_dates(page)
+    
+    # Collect all text in one TextWriter and write it to the page in a single pass
+    writer = fitz.TextWriter(page.rect)
     
     # Fill checkboxes
-    print("Filling checkbox fields...")
-    fill_checkboxes(page, data)
+    logger.info("Filling checkbox fields...")
+    fill_checkboxes(writer, data)
     
     # Fill text fields
-    print("Filling text fields...")
-    fill_text_fields(page, data)
+    logger.info("Filling text fields...")
+    arabic_queued = fill_text_fields(writer, data)
+    
+    writer.write_text(page)
+    subset_embedded_fonts(doc, arabic_queued)
     
     # Save the filled form
-    print(f"Saving filled form to: {output_path}")
+    logger.info(f"Saving filled form to: {output_path}")
     doc.save(output_path)
     doc.close()
     
-    print("✓ Form filled successfully!")
+    logger.info("✓ Form filled successfully!")
     return output_path
 
 
 def main():
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     parser = argparse.ArgumentParser(
         description="Fill Lebanon Visa Application Form with data from JSON"
     )
@@ -406,6 +508,11 @@ def main():
         default="output/filled_visa_form.pdf",
         help="Output path for filled PDF (default: output/filled_visa_form.pdf)",
     )
+    parser.add_argument(
+        "--pre-redacted",
+        action="store_true",
+        help="Template was produced by scripts/preprocess_template.py; skip date redaction",
+    )
     
     args = parser.parse_args()
     
@@ -435,7 +542,24 @@ def main():
         exit(1)
     
     # Fill the form
-    fill_visa_form(str(template_path), str(data_path), str(output_path))
+    fill_visa_form(str(template_path), str(data_path), str(output_path), pre_redacted=args.pre_redacted)
+
+
+def warmup():
+    """Exercise MuPDF once (document, fonts, text writing, serialization) so
+    its lazy initialization happens at startup rather than on the first request."""
+    doc = fitz.open()
+    page = doc.new_page(width=10, height=10)
+    writer = fitz.TextWriter(page.rect)
+    writer.append((1, 5), "x", font=TEXT_FONT, fontsize=6)
+    writer.write_text(page)
+    doc.tobytes(deflate=True)
+    doc.close()
+
+
+# Set VISA_WARMUP=0 to skip (e.g. in tests or short-lived scripts)
+if os.environ.get("VISA_WARMUP", "1") == "1":
+    warmup()
 
 
 if __name__ == "__main__":
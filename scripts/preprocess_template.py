@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Build-time preprocessing for the visa form template
+
+Applies the static redactions (pre-filled dates at point 19) once and writes
+a redacted copy of the template, so PDF generation can skip them per request.
+
+Usage:
+    python scripts/preprocess_template.py
+    python scripts/preprocess_template.py --template Visa_Application_Form.pdf --output Visa_Application_Form_redacted.pdf
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Allow importing fill_visa_form from the project root
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_DIR))
+
+import fitz  # PyMuPDF
+
+from fill_visa_form import redact_existing_dates
+
+
+def preprocess_template(template_path: str, output_path: str):
+    """Redact the template's pre-filled dates and save a compacted copy."""
+    doc = fitz.open(template_path)
+    redact_existing_dates(doc[0])
+    doc.save(
+        output_path,
+        garbage=4,  # Maximum garbage collection (remove unused objects)
+        deflate=True,  # Compress streams
+        clean=True,  # Clean and sanitize content streams
+    )
+    doc.close()
+    print(f"✓ Redacted template saved to: {output_path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Pre-redact the visa form template so redaction is skipped at runtime"
+    )
+    parser.add_argument(
+        "--template",
+        "-t",
+        default=str(PROJECT_DIR / "Visa_Application_Form.pdf"),
+        help="Path to the original PDF form template",
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        default=str(PROJECT_DIR / "Visa_Application_Form_redacted.pdf"),
+        help="Output path for the redacted template",
+    )
+    args = parser.parse_args()
+    
+    preprocess_template(args.template, args.output)
+
+
+if __name__ == "__main__":
+    main()